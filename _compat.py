@@ -0,0 +1,26 @@
+"""
+Backports of newer standard-library features (the code targets Python 3.8).
+
+Kept free of third-party imports so that the plan-format helpers in utils/
+can use it without loading the geometry stack.
+"""
+from dataclasses import fields
+
+
+def _slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields (no per-instance __dict__).
+    Equivalent to @dataclass(slots=True), which needs Python >= 3.10.
+
+    Names listed in a `_cache_slots` class attribute get extra slots that are
+    not dataclass fields (so they stay out of fields/asdict/astuple/repr/eq).
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names + tuple(cls_dict.pop("_cache_slots", ()))
+    for name in field_names:
+        # defaults live in the generated __init__, not as class attributes
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
@@ -0,0 +1,248 @@
+"""
+Batched coordinate-conversion kernels.
+
+The kernels are compiled with Numba when it is installed; otherwise an
+equivalent NumPy implementation is used. Inputs are expected as C-contiguous
+1-D arrays (float32 or float64; the math is always done in float64) and
+results are written into preallocated 1-D float64 output arrays.
+
+The kernels are deliberately serial (no parallel=True): trajectories are a
+few to a hundred points, and starting Numba's threading layer would make the
+caller's process unsafe to fork (multiprocessing "fork" pools hang at exit).
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# WGS84 ellipsoid (same constants as pymap3d's default)
+WGS84_A = 6378137.0
+WGS84_B = 6356752.31424518
+WGS84_E2 = (WGS84_A**2 - WGS84_B**2) / WGS84_A**2
+WGS84_EP2 = (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+
+
+def _origin_ecef(lat0, lon0, h0):
+    """Return sin/cos of the origin and its ECEF position (angles in degrees)."""
+    lat0 = math.radians(lat0)
+    lon0 = math.radians(lon0)
+    slat, clat = math.sin(lat0), math.cos(lat0)
+    slon, clon = math.sin(lon0), math.cos(lon0)
+
+    N0 = WGS84_A / math.sqrt(1.0 - WGS84_E2 * slat * slat)
+    x0 = (N0 + h0) * clat * clon
+    y0 = (N0 + h0) * clat * slon
+    z0 = (N0 * (1.0 - WGS84_E2) + h0) * slat
+    return slat, clat, slon, clon, x0, y0, z0
+
+
+def _ecef_to_geodetic_point(X, Y, Z):
+    """ECEF → geodetic for a single point with Heikkinen's closed form (degrees, meters)."""
+    a, b = WGS84_A, WGS84_B
+    e2, ep2 = WGS84_E2, WGS84_EP2
+    a2, b2 = a * a, b * b
+    e4 = e2 * e2
+
+    p = math.hypot(X, Y)
+    p2 = p * p
+    Z2 = Z * Z
+    F = 54.0 * b2 * Z2
+    G = p2 + (1.0 - e2) * Z2 - e2 * (a2 - b2)
+    c = e4 * F * p2 / (G * G * G)
+    s = (1.0 + c + math.sqrt(c * c + 2.0 * c)) ** (1.0 / 3.0)
+    k = s + 1.0 + 1.0 / s
+    P = F / (3.0 * k * k * G * G)
+    Q = math.sqrt(1.0 + 2.0 * e4 * P)
+    r0 = -P * e2 * p / (1.0 + Q) + math.sqrt(
+        0.5 * a2 * (1.0 + 1.0 / Q) - P * (1.0 - e2) * Z2 / (Q * (1.0 + Q)) - 0.5 * P * p2
+    )
+    dp = p - e2 * r0
+    U = math.hypot(dp, Z)
+    V = math.sqrt(dp * dp + (1.0 - e2) * Z2)
+    zz = b2 * Z / (a * V)
+
+    lat = math.degrees(math.atan((Z + ep2 * zz) / p))
+    lon = math.degrees(math.atan2(Y, X))
+    alt = U * (1.0 - b2 / (a * V))
+    return lat, lon, alt
+
+
+def geodetic_to_enu_scalar(lat, lon, alt, origin_trig, origin_ecef):
+    """
+    Single-point geodetic → ENU using only the math module.
+
+    origin_trig is (sin lat0, cos lat0, sin lon0, cos lon0) and origin_ecef is
+    (x0, y0, z0), as cached by Site.
+    """
+    lat = math.radians(lat)
+    lon = math.radians(lon)
+    slat, clat = math.sin(lat), math.cos(lat)
+    N = WGS84_A / math.sqrt(1.0 - WGS84_E2 * slat * slat)
+
+    x0, y0, z0 = origin_ecef
+    dx = (N + alt) * clat * math.cos(lon) - x0
+    dy = (N + alt) * clat * math.sin(lon) - y0
+    dz = (N * (1.0 - WGS84_E2) + alt) * slat - z0
+
+    slat0, clat0, slon0, clon0 = origin_trig
+    t = clon0 * dx + slon0 * dy
+    return -slon0 * dx + clon0 * dy, -slat0 * t + clat0 * dz, clat0 * t + slat0 * dz
+
+
+def enu_to_geodetic_scalar(e, n, u, origin_trig, origin_ecef):
+    """Single-point ENU → geodetic using only the math module (see geodetic_to_enu_scalar)."""
+    x0, y0, z0 = origin_ecef
+    slat0, clat0, slon0, clon0 = origin_trig
+    t = clat0 * u - slat0 * n
+    return _ecef_to_geodetic_point(
+        x0 + clon0 * t - slon0 * e,
+        y0 + slon0 * t + clon0 * e,
+        z0 + slat0 * u + clat0 * n,
+    )
+
+
+if HAVE_NUMBA:
+    _ecef_to_geodetic_point_nb = njit(inline="always", fastmath=True, cache=True)(_ecef_to_geodetic_point)
+else:
+    _ecef_to_geodetic_point_nb = _ecef_to_geodetic_point
+
+
+def _enu_to_geodetic_loop(e, n, u, lat0, lon0, h0, out_lat, out_lon, out_alt):
+    """
+    ENU → ECEF → geodetic for every point, using Heikkinen's closed-form
+    inversion. Writes lat, lon [deg] and alt [m] into the three output arrays.
+    """
+    a, e2 = WGS84_A, WGS84_E2
+
+    # origin trigonometry is hoisted out of the loop
+    lat0 = math.radians(lat0)
+    lon0 = math.radians(lon0)
+    slat, clat = math.sin(lat0), math.cos(lat0)
+    slon, clon = math.sin(lon0), math.cos(lon0)
+    N0 = a / math.sqrt(1.0 - e2 * slat * slat)
+    x0 = (N0 + h0) * clat * clon
+    y0 = (N0 + h0) * clat * slon
+    z0 = (N0 * (1.0 - e2) + h0) * slat
+
+    for i in range(e.shape[0]):
+        # ENU → ECEF
+        t = clat * u[i] - slat * n[i]
+        X = x0 + clon * t - slon * e[i]
+        Y = y0 + slon * t + clon * e[i]
+        Z = z0 + slat * u[i] + clat * n[i]
+
+        # ECEF → geodetic (Heikkinen)
+        out_lat[i], out_lon[i], out_alt[i] = _ecef_to_geodetic_point_nb(X, Y, Z)
+
+
+def _enu_to_geodetic_numpy(e, n, u, lat0, lon0, h0, out_lat, out_lon, out_alt):
+    """NumPy version of _enu_to_geodetic_loop, used when Numba is unavailable."""
+    a, b = WGS84_A, WGS84_B
+    e2, ep2 = WGS84_E2, WGS84_EP2
+    a2, b2 = a * a, b * b
+    e4 = e2 * e2
+
+    slat, clat, slon, clon, x0, y0, z0 = _origin_ecef(lat0, lon0, h0)
+
+    # float32 ENU would otherwise stay float32 when combined with Python floats
+    e = np.asarray(e, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    u = np.asarray(u, dtype=np.float64)
+
+    # ENU → ECEF
+    t = clat * u - slat * n
+    X = x0 + clon * t - slon * e
+    Y = y0 + slon * t + clon * e
+    Z = z0 + slat * u + clat * n
+
+    # ECEF → geodetic (Heikkinen)
+    p2 = X * X + Y * Y
+    p = np.sqrt(p2)
+    Z2 = Z * Z
+    F = 54.0 * b2 * Z2
+    G = p2 + (1.0 - e2) * Z2 - e2 * (a2 - b2)
+    c = e4 * F * p2 / (G * G * G)
+    s = np.cbrt(1.0 + c + np.sqrt(c * c + 2.0 * c))
+    k = s + 1.0 + 1.0 / s
+    P = F / (3.0 * k * k * G * G)
+    Q = np.sqrt(1.0 + 2.0 * e4 * P)
+    r0 = -P * e2 * p / (1.0 + Q) + np.sqrt(
+        0.5 * a2 * (1.0 + 1.0 / Q) - P * (1.0 - e2) * Z2 / (Q * (1.0 + Q)) - 0.5 * P * p2
+    )
+    dp = p - e2 * r0
+    U = np.sqrt(dp * dp + Z2)
+    V = np.sqrt(dp * dp + (1.0 - e2) * Z2)
+    zz = b2 * Z / (a * V)
+
+    np.degrees(np.arctan((Z + ep2 * zz) / p), out=out_lat)
+    np.degrees(np.arctan2(Y, X), out=out_lon)
+    out_alt[:] = U * (1.0 - b2 / (a * V))
+
+
+if HAVE_NUMBA:
+    enu_to_geodetic_batch = njit(fastmath=True, cache=True)(_enu_to_geodetic_loop)
+else:
+    enu_to_geodetic_batch = _enu_to_geodetic_numpy
+
+
+def _aer_from_enu_loop(points_enu, tel_pos, out):
+    """
+    (az, el, srange) of ENU points (N,3) as seen from tel_pos (3,), written into
+    out (N,3) in a single pass: az/el in degrees, slant range in meters.
+    """
+    te, tn, tu = tel_pos[0], tel_pos[1], tel_pos[2]
+    for i in range(points_enu.shape[0]):
+        de = points_enu[i, 0] - te
+        dn = points_enu[i, 1] - tn
+        du = points_enu[i, 2] - tu
+        horiz = math.hypot(de, dn)
+        out[i, 0] = math.degrees(math.atan2(de, dn)) % 360.0
+        out[i, 1] = math.degrees(math.atan2(du, horiz))
+        out[i, 2] = math.hypot(horiz, du)
+
+
+def _aer_from_enu_numpy(points_enu, tel_pos, out):
+    """NumPy version of _aer_from_enu_loop, used when Numba is unavailable."""
+    d = np.asarray(points_enu, dtype=np.float64) - tel_pos
+    de, dn, du = d[:, 0], d[:, 1], d[:, 2]
+    horiz = np.hypot(de, dn)
+    out[:, 0] = np.degrees(np.arctan2(de, dn)) % 360.0
+    out[:, 1] = np.degrees(np.arctan2(du, horiz))
+    out[:, 2] = np.hypot(horiz, du)
+
+
+if HAVE_NUMBA:
+    aer_from_enu = njit(fastmath=True, cache=True)(_aer_from_enu_loop)
+else:
+    aer_from_enu = _aer_from_enu_numpy
+
+
+def _arc_to_enu_loop(az, el, srange, center, out):
+    """
+    ENU points (N,3) of an arc of constant azimuth az and slant range srange
+    around center (3,), one point per elevation in el (radians).
+    """
+    saz, caz = math.sin(az), math.cos(az)
+    for i in range(el.shape[0]):
+        r = srange * math.cos(el[i])
+        out[i, 0] = center[0] + r * saz
+        out[i, 1] = center[1] + r * caz
+        out[i, 2] = center[2] + srange * math.sin(el[i])
+
+
+def _arc_to_enu_numpy(az, el, srange, center, out):
+    """NumPy version of _arc_to_enu_loop, used when Numba is unavailable."""
+    r = srange * np.cos(el)
+    out[:, 0] = center[0] + r * math.sin(az)
+    out[:, 1] = center[1] + r * math.cos(az)
+    out[:, 2] = center[2] + srange * np.sin(el)
+
+
+if HAVE_NUMBA:
+    arc_to_enu = njit(fastmath=True, cache=True)(_arc_to_enu_loop)
+else:
+    arc_to_enu = _arc_to_enu_numpy
@@ -1,29 +1,66 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Union
 import json
+import math
 import numpy as np
+import os
 import pymap3d as pm
 import warnings
 
+from _compat import _slots
+from _kernels import aer_from_enu, enu_to_geodetic_batch, enu_to_geodetic_scalar, geodetic_to_enu_scalar
+
+try:
+    from pyproj import Transformer
+    HAVE_PYPROJ = True
+except ImportError:
+    HAVE_PYPROJ = False
+
+# batch geodetic <-> ENU goes through a PROJ topocentric pipeline when pyproj
+# is installed; set DRONE_FLIGHTPLANS_USE_PYPROJ=0 to use pymap3d instead
+_USE_PYPROJ = HAVE_PYPROJ and os.environ.get("DRONE_FLIGHTPLANS_USE_PYPROJ", "1") == "1"
+
+def _cached_array(obj, values: tuple) -> np.ndarray:
+    """
+    Return obj's cached array of `values`, rebuilding it only if they changed
+    since the last call. The array is read-only as it is shared between calls.
+    """
+    # the cache slots start out unset, hence getattr
+    if getattr(obj, "_arr_key", None) != values:
+        arr = np.array(values, dtype=np.float64)
+        arr.flags.writeable = False
+        obj._arr = arr
+        obj._arr_key = values
+    return obj._arr
+
+@_slots
 @dataclass
 class Geodetic:
     lat: float
     lon: float
     alt: float
+    # as_array() cache, kept in plain slots rather than dataclass fields
+    _cache_slots = ("_arr", "_arr_key")
+
     def as_array(self):
-        return np.array([self.e, self.n, self.u])
+        return _cached_array(self, (self.lat, self.lon, self.alt))
     
+@_slots
 @dataclass
 class ECEF:
     x: float
     y: float
     z: float
 
+@_slots
 @dataclass
 class ENU:
     e: float
     n: float
     u: float
+    # as_array() cache, kept in plain slots rather than dataclass fields
+    _cache_slots = ("_arr", "_arr_key")
+
     def __sub__(self, other: "ENU") -> "ENU":
         if not isinstance(other, ENU):
             return NotImplemented
@@ -35,8 +72,9 @@ class ENU:
         return ENU(self.e + other.e, self.n + other.n, self.u + other.u)
 
     def as_array(self):
-        return np.array([self.e, self.n, self.u])
+        return _cached_array(self, (self.e, self.n, self.u))
 
+@_slots
 @dataclass
 class Telescope:
     name: str
@@ -45,51 +83,123 @@ class Telescope:
     ecef: Optional[ECEF] = None
     enu: Optional[ENU] = None
 
-@dataclass
+def _arc_indices(npoints, n_repeat):
+    """Indices of the arc flown back and forth n_repeat times (0..N-1, N-2..1, ...)."""
+    idx = np.concatenate([np.arange(npoints), np.arange(npoints-2, 0, -1)])
+    return np.tile(idx, n_repeat)
+
 class DroneTrajectory:
-    enu: np.ndarray  # shape (N, 3), efficient and compact
-    yaw: np.ndarray
-    pitch: np.ndarray
-    npoints: int
-    arccenter: Optional[ENU] = None
-    geodetic: Optional[np.ndarray] = None
-    poi: Optional[Geodetic] = None
-    landing_site: Optional[Geodetic]=None
-    curveradius: Optional[float]=None
-    plot_boresight: Optional[bool]=False
-    
+    """
+    Drone trajectory stored as structure-of-arrays.
+
+    ENU and geodetic coordinates are kept in (3, N) row-contiguous buffers, so
+    E/N/U and LAT/LON/ALT are unit-stride views. The `enu` and `geodetic`
+    attributes expose the usual (N, 3) layout as a transposed view of the same
+    memory (no copy).
+
+    ENU is stored as float32: in the few-km local frame this keeps sub-mm
+    precision at half the memory. Geodetic coordinates stay float64, since
+    latitude/longitude need the full precision.
+    """
+
+    def __init__(
+        self,
+        enu: np.ndarray,  # shape (N, 3)
+        yaw: np.ndarray,
+        pitch: np.ndarray,
+        npoints: int,
+        arccenter: Optional[ENU] = None,
+        geodetic: Optional[np.ndarray] = None,
+        poi: Optional[Geodetic] = None,
+        landing_site: Optional[Geodetic] = None,
+        curveradius: Optional[float] = None,
+        plot_boresight: Optional[bool] = False,
+    ):
+        self.enu = enu
+        self.yaw = yaw
+        self.pitch = pitch
+        self.npoints = npoints
+        self.arccenter = arccenter
+        self.geodetic = geodetic
+        self.poi = poi
+        self.landing_site = landing_site
+        self.curveradius = curveradius
+        self.plot_boresight = plot_boresight
+
+    def __repr__(self):
+        return (
+            f"DroneTrajectory(npoints={self.npoints}, curveradius={self.curveradius!r}, "
+            f"poi={self.poi!r}, arccenter={self.arccenter!r}, "
+            f"geodetic={'computed' if self._geodetic is not None else 'not computed'})"
+        )
+
+    @staticmethod
+    def _to_rows(arr: np.ndarray, name: str, dtype) -> np.ndarray:
+        """Convert an (N,3) array into a row-contiguous (3,N) buffer."""
+        arr = np.asarray(arr)
+        if arr.ndim != 2 or arr.shape[1] != 3:
+            raise ValueError(f"{name} must have shape (N,3).")
+        return np.ascontiguousarray(arr.T, dtype=dtype)
+
+    @property
+    def enu(self) -> np.ndarray:
+        return self._enu.T
+
+    @enu.setter
+    def enu(self, enu: np.ndarray):
+        self._enu = self._to_rows(enu, "enu", np.float32)
+        self._geodetic_cache_key = None
+
+    @property
+    def geodetic(self) -> Optional[np.ndarray]:
+        if self._geodetic is None:
+            return None
+        return self._geodetic.T
+
+    @geodetic.setter
+    def geodetic(self, geodetic: Optional[np.ndarray]):
+        self._geodetic = None if geodetic is None else self._to_rows(geodetic, "geodetic", np.float64)
+        self._geodetic_cache_key = None
+        self._mission_cache = {}
+
     @property
     def E(self):
-        return self.enu[:, 0]
+        return self._enu[0]
 
     @property
     def N(self):
-        return self.enu[:, 1]
+        return self._enu[1]
 
     @property
     def U(self):
-        return self.enu[:, 2]
+        return self._enu[2]
     
     @property
     def LAT(self):
-        if self.geodetic is None:
+        if self._geodetic is None:
             raise ValueError("Geodetic coordinates not computed yet. Call compute_geodetic(site) first.")
-        return self.geodetic[:, 0]
+        return self._geodetic[0]
 
     @property
     def LON(self):
-        if self.geodetic is None:
+        if self._geodetic is None:
             raise ValueError("Geodetic coordinates not computed yet. Call compute_geodetic(site) first.")
-        return self.geodetic[:, 1]
+        return self._geodetic[1]
 
     @property
     def ALT(self):
-        if self.geodetic is None:
+        if self._geodetic is None:
             raise ValueError("Geodetic coordinates not computed yet. Call compute_geodetic(site) first.")
-        return self.geodetic[:, 2]
+        return self._geodetic[2]
     
     def compute_geodetic(self, site: "Union[Site, Geodetic]"):
-        
+        """
+        Compute the geodetic coordinates of the trajectory from its ENU ones.
+
+        The result is cached on the origin: calling it again with the same
+        origin is a no-op until `enu` is reassigned. In-place edits of the
+        `enu` array are not tracked, reassign it instead.
+        """
         if isinstance(site, Site):
             if site.origin is None:
                 raise ValueError("Site origin must be set to convert ENU → geodetic.")
@@ -98,15 +208,56 @@ class DroneTrajectory:
             origin=site
         else:
             raise TypeError("Site origin mist be eiter Site or Geodetic")
+
+        key = (origin.lat, origin.lon, origin.alt)
+        if self._geodetic_cache_key == key and self._geodetic is not None:
+            return
             
-        lats, lons, alts = pm.enu2geodetic(
+        # the kernel reads float32 ENU, works in float64 and fills the lat/lon/alt rows in place
+        geodetic = np.empty(self._enu.shape, dtype=np.float64)
+        enu_to_geodetic_batch(
             self.E, self.N, self.U,
-            origin.lat, origin.lon, origin.alt
+            float(origin.lat), float(origin.lon), float(origin.alt),
+            geodetic[0], geodetic[1], geodetic[2],
         )
-
-        # store vectorized array
-        self.geodetic = np.column_stack([lats, lons, alts])
+        self._geodetic = geodetic
+        self._geodetic_cache_key = key
+        self._mission_cache = {}
         
+    def _mission_sequence(self, landing_alt: float, n_repeat: int):
+        """
+        Waypoint sequence shared by the mission exporters: the arc flown back
+        and forth n_repeat times, with altitudes relative to landing_alt.
+
+        Returns read-only (lat, lon, alt, yaw, pitch) arrays (yaw/pitch are None
+        if the trajectory has none). The result is cached per
+        (landing_alt, n_repeat) until the geodetic coordinates, yaw or pitch
+        are reassigned.
+        """
+        if self._geodetic is None:
+            raise ValueError("Geodetic coordinates not computed yet. Call compute_geodetic(site) first.")
+
+        key = (float(landing_alt), n_repeat)
+        cached = self._mission_cache.get(key)
+        if cached is not None and cached[0] is self.yaw and cached[1] is self.pitch:
+            return cached[2]
+
+        idx = _arc_indices(self._geodetic.shape[1], n_repeat)
+        sequence = (
+            self.LAT[idx],
+            self.LON[idx],
+            self.ALT[idx] - landing_alt,
+            None if self.yaw is None else np.asarray(self.yaw, dtype=np.float64)[idx],
+            None if self.pitch is None else np.asarray(self.pitch, dtype=np.float64)[idx],
+        )
+        for arr in sequence:
+            if arr is not None:
+                arr.flags.writeable = False
+
+        # keep yaw/pitch referenced so that their identity check stays valid
+        self._mission_cache[key] = (self.yaw, self.pitch, sequence)
+        return sequence
+
     def export_kml(self, path: str):
         """
         Export the trajectory to a KML file using simplekml.
@@ -177,7 +328,21 @@ class Site:
         # Optional origin (can be set later, e.g., barycenter)
         origin = data.get("origin")
         self.origin: Optional[Geodetic] = Geodetic(**origin) if origin else None
+
+        # memoized results, invalidated when the telescope geometry changes
+        self._barycenter_cache: Optional[tuple] = None
+        self._enu_cache: Dict[tuple, Dict[str, tuple]] = {}
+        self._enu_cache_telescopes: Optional[tuple] = None
         
+    def __getstate__(self):
+        # the PROJ transformer is rebuilt from the origin when unpickling
+        state = self.__dict__.copy()
+        state["_enu_transformer"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_origin_trig()
     
     def set_origin(self, geodetic: Optional[Geodetic] = None):
         """Set the site origin and update ENU coordinates of all telescopes."""
@@ -188,49 +353,158 @@ class Site:
         
         self.origin = geodetic
         self._update_all_enu()
+
+    @property
+    def origin(self) -> Optional[Geodetic]:
+        return self._origin
+
+    @origin.setter
+    def origin(self, geodetic: Optional[Geodetic]):
+        """Reassigning the origin refreshes the cached origin trigonometry."""
+        self._origin = geodetic
+        self._cache_origin_trig()
+
+    def _cache_origin_trig(self):
+        """
+        Precompute sin/cos, ECEF and the ECEF → ENU rotation of the origin
+        (and the PROJ topocentric transformer, if pyproj is used).
+        """
+        if self._origin is None:
+            self._origin_trig = None
+            self._origin_ecef = None
+            self._R_ecef_to_enu = None
+            self._enu_transformer = None
+            return
+
+        lat0 = math.radians(self._origin.lat)
+        lon0 = math.radians(self._origin.lon)
+        slat, clat, slon, clon = math.sin(lat0), math.cos(lat0), math.sin(lon0), math.cos(lon0)
+        self._origin_trig = (slat, clat, slon, clon)
+        self._origin_ecef = tuple(float(c) for c in pm.geodetic2ecef(
+            self._origin.lat, self._origin.lon, self._origin.alt
+        ))
+        self._R_ecef_to_enu = np.array([
+            [-slon, clon, 0.0],
+            [-slat * clon, -slat * slon, clat],
+            [clat * clon, clat * slon, slat],
+        ])
+        # forward: (lon, lat, alt) → (e, n, u); inverse: (e, n, u) → (lon, lat, alt)
+        self._enu_transformer = Transformer.from_pipeline(
+            "+proj=pipeline "
+            "+step +proj=cart +ellps=WGS84 "
+            f"+step +proj=topocentric +ellps=WGS84 +lat_0={float(self._origin.lat)!r} +lon_0={float(self._origin.lon)!r} +h_0={float(self._origin.alt)!r}"
+        ) if _USE_PYPROJ else None
+
+    def _geodetic_to_enu_arrays(self, lat, lon, alt):
+        """Geodetic → ENU (scalars or arrays) using the cached origin rotation."""
+        if self._enu_transformer is not None:
+            return self._enu_transformer.transform(lon, lat, alt)
+
+        x, y, z = pm.geodetic2ecef(lat, lon, alt)
+        x0, y0, z0 = self._origin_ecef
+        slat, clat, slon, clon = self._origin_trig
+
+        dx, dy, dz = x - x0, y - y0, z - z0
+        t = clon * dx + slon * dy
+
+        e = -slon * dx + clon * dy
+        n = -slat * t + clat * dz
+        u = clat * t + slat * dz
+        return e, n, u
+
+    def _enu_to_geodetic_arrays(self, e, n, u):
+        """ENU → Geodetic (scalars or arrays) using the cached origin rotation."""
+        if self._enu_transformer is not None:
+            lon, lat, alt = self._enu_transformer.transform(e, n, u, direction="INVERSE")
+            return lat, lon, alt
+
+        x0, y0, z0 = self._origin_ecef
+        slat, clat, slon, clon = self._origin_trig
+
+        t = clat * u - slat * n
+        x = x0 + clon * t - slon * e
+        y = y0 + slon * t + clon * e
+        z = z0 + slat * u + clat * n
+        return pm.ecef2geodetic(x, y, z)
         
         
+    def _telescopes_key(self) -> tuple:
+        """Hashable snapshot of the telescope geometry, used to invalidate the caches."""
+        return tuple(
+            (name, t.geodetic.lat, t.geodetic.lon, t.geodetic.alt, t.focalplane_height)
+            for name, t in self.telescopes.items()
+        )
+
+    def _telescope_geodetic_arrays(self):
+        """Return (lat, lon, alt + focalplane_height) of all telescopes as three arrays."""
+        ntel = len(self.telescopes)
+        lats, lons, hs = np.empty(ntel), np.empty(ntel), np.empty(ntel)
+        for i, t in enumerate(self.telescopes.values()):
+            lats[i] = t.geodetic.lat
+            lons[i] = t.geodetic.lon
+            hs[i] = t.geodetic.alt + t.focalplane_height
+        return lats, lons, hs
+
     def _update_all_enu(self):
         """Compute ENU coordinates for all telescopes relative to the site origin."""
         if self.origin is None:
             raise ValueError("Origin must be set before computing ENU coordinates.")
 
-        for t in self.telescopes.values():
-            e, n, u = pm.geodetic2enu(
-                lat=t.geodetic.lat,
-                lon=t.geodetic.lon,
-                h=t.geodetic.alt + t.focalplane_height,
-                lat0=self.origin.lat,
-                lon0=self.origin.lon,
-                h0=self.origin.alt,
-            )
+        tel_key = self._telescopes_key()
+        if tel_key != self._enu_cache_telescopes:
+            self._enu_cache.clear()
+            self._enu_cache_telescopes = tel_key
+
+        origin_key = (self.origin.lat, self.origin.lon, self.origin.alt)
+        enu_by_name = self._enu_cache.get(origin_key)
+
+        if enu_by_name is None:
+            # stack all telescopes and convert them in one batched call
+            lats, lons, hs = self._telescope_geodetic_arrays()
+
+            e, n, u = self._geodetic_to_enu_arrays(lats, lons, hs)
+            enu_by_name = {
+                name: (float(ei), float(ni), float(ui))
+                for name, ei, ni, ui in zip(self.telescopes.keys(), e, n, u)
+            }
+            self._enu_cache[origin_key] = enu_by_name
+
+        for name, t in self.telescopes.items():
+            e, n, u = enu_by_name[name]
             t.enu = ENU(e=e, n=n, u=u)
             
     def compute_barycenter(self):
         """Compute the geodetic barycenter of all telescopes (including focal heights) using NumPy."""
         if not self.telescopes:
             raise ValueError("No telescopes defined in the site.")
+
+        tel_key = self._telescopes_key()
+        if self._barycenter_cache is not None and self._barycenter_cache[0] == tel_key:
+            lat, lon, alt = self._barycenter_cache[1]
+            return Geodetic(lat=lat, lon=lon, alt=alt)
             
-        ecef_coords_list = []
-        for t in self.telescopes.values():
-            x, y, z = pm.geodetic2ecef(
-                lat=t.geodetic.lat,
-                lon=t.geodetic.lon,
-                alt=t.geodetic.alt + t.focalplane_height
-            )
-            ecef_coords_list.append([x, y, z])
-        ecef_coords = np.array(ecef_coords_list)  
+        lats, lons, hs = self._telescope_geodetic_arrays()
 
-        # Compute mean of X, Y, Z
-        Xc, Yc, Zc = np.mean(ecef_coords, axis=0)
+        x, y, z = pm.geodetic2ecef(lat=lats, lon=lons, alt=hs)
+
+        # Compute mean of X, Y, Z (fsum keeps full precision on ~6e6 m coordinates)
+        Xc, Yc, Zc = (math.fsum(c) / len(c) for c in (x, y, z))
 
         # Convert back to geodetic
         lat, lon, alt = pm.ecef2geodetic(Xc, Yc, Zc)
+        lat, lon, alt = float(lat), float(lon), float(alt)
+        self._barycenter_cache = (tel_key, (lat, lon, alt))
 
         return Geodetic(lat=lat, lon=lon, alt=alt)
         
     def geodetic_to_enu(self, geo):
-    
+        """
+        Convert a single Geodetic position or an array of geodetic points
+        to ENU coordinates relative to the site origin.
+
+        Array inputs of shape (N,3) may have any memory layout: they are
+        split into three unit-stride (lat, lon, alt) rows before conversion.
+        """
         if self.origin is None:
             raise ValueError("Origin must be set before converting to ENU.")
     
@@ -238,13 +512,9 @@ class Site:
         # Case 1: single object
         # ---------------------------------------------------------
         if isinstance(geo, Geodetic):
-            e, n, u = pm.geodetic2enu(
-                lat=geo.lat,
-                lon=geo.lon,
-                h=geo.alt,
-                lat0=self.origin.lat,
-                lon0=self.origin.lon,
-                h0=self.origin.alt
+            e, n, u = geodetic_to_enu_scalar(
+                float(geo.lat), float(geo.lon), float(geo.alt),
+                self._origin_trig, self._origin_ecef,
             )
             return ENU(e=e, n=n, u=u)
     
@@ -255,18 +525,11 @@ class Site:
             if geo.ndim != 2 or geo.shape[1] != 3:
                 raise ValueError("NumPy input must have shape (N,3) as (lat, lon, alt).")
     
-            lat = geo[:, 0]
-            lon = geo[:, 1]
-            alt = geo[:, 2]
-    
-            e, n, u = pm.geodetic2enu(
-                lat=lat,
-                lon=lon,
-                h=alt,
-                lat0=self.origin.lat,
-                lon0=self.origin.lon,
-                h0=self.origin.alt
-            )
+            # (3,N) C-contiguous copy → each row is a unit-stride column;
+            # free when geo is already a transposed view (e.g. DroneTrajectory.geodetic)
+            lat, lon, alt = np.ascontiguousarray(geo.T, dtype=np.float64)
+    
+            e, n, u = self._geodetic_to_enu_arrays(lat, lon, alt)
             return np.column_stack([e, n, u])
     
         raise TypeError("Input must be a Geodetic object or a NumPy array of shape (N,3).")
@@ -280,13 +543,16 @@ class Site:
         ----------
         enu : ENU | np.ndarray
             - ENU(e, n, u)
-            - OR NumPy array of shape (N,3)
+            - OR NumPy array of shape (N,3) (any memory layout; it is split
+              into three unit-stride (e, n, u) rows before conversion)
+            - OR NumPy array of shape (3,) for a single point
     
         Returns
         -------
         Geodetic | np.ndarray
             - Geodetic(lat, lon, alt) for single input
             - np.ndarray of shape (N,3) for batch input
+            - np.ndarray of shape (3,) for a single-point array
         """
         if self.origin is None:
             raise ValueError("Origin must be set before converting to Geodetic.")
@@ -295,13 +561,9 @@ class Site:
         # Case 1: single ENU object
         # ---------------------------------------------------------
         if isinstance(enu, ENU):
-            lat, lon, alt = pm.enu2geodetic(
-                e=enu.e,
-                n=enu.n,
-                u=enu.u,
-                lat0=self.origin.lat,
-                lon0=self.origin.lon,
-                h0=self.origin.alt
+            lat, lon, alt = enu_to_geodetic_scalar(
+                float(enu.e), float(enu.n), float(enu.u),
+                self._origin_trig, self._origin_ecef,
             )
             return Geodetic(lat=lat, lon=lon, alt=alt)
     
@@ -311,41 +573,23 @@ class Site:
         if isinstance(enu, np.ndarray):
             if enu.ndim == 2 and enu.shape[1] == 3:
                 
-                e = enu[:, 0]
-                n = enu[:, 1]
-                u = enu[:, 2]
+                e, n, u = np.ascontiguousarray(enu.T, dtype=np.float64)
         
-                lat, lon, alt = pm.enu2geodetic(
-                    e=e,
-                    n=n,
-                    u=u,
-                    lat0=self.origin.lat,
-                    lon0=self.origin.lon,
-                    h0=self.origin.alt
-                )
+                lat, lon, alt = self._enu_to_geodetic_arrays(e, n, u)
                 return np.column_stack([lat, lon, alt])
 
-            elif enu.ndim == 0 and enu.shape[0] == 3:
+            elif enu.ndim == 1 and enu.shape[0] == 3:
                 
-                e = enu[0]
-                n = enu[1]
-                u = enu[2]
+                e, n, u = enu.tolist()
         
-                lat, lon, alt = pm.enu2geodetic(
-                    e=e,
-                    n=n,
-                    u=u,
-                    lat0=self.origin.lat,
-                    lon0=self.origin.lon,
-                    h0=self.origin.alt
-                )
-                return np.column_stack([lat, lon, alt])
+                lat, lon, alt = enu_to_geodetic_scalar(e, n, u, self._origin_trig, self._origin_ecef)
+                return np.array([lat, lon, alt], dtype=np.float64)
 
             else:
-                raise ValueError("NumPy input must have shape (N,3) as (e, n, u).")
+                raise ValueError("NumPy input must have shape (N,3) or (3,) as (e, n, u).")
     
     
-        raise TypeError("Input must be an ENU object or a NumPy array of shape (N,3).")
+        raise TypeError("Input must be an ENU object or a NumPy array of shape (N,3) or (3,).")
 
 
     def observe_points(self,
@@ -356,9 +600,8 @@ class Site:
         
         Parameters
         ----------
-        points : list or np.ndarray
-            Either a list/array of Geodetic or ENU objects, OR a NumPy array
-            of shape (N,3) interpreted as (lat,lon,alt) or (e,n,u).
+        points_geodetic : np.ndarray
+            NumPy array of shape (N,3) interpreted as (lat,lon,alt).
         telescope : str | Telescope | Geodetic | ENU
             Telescope selector. Can be:
             - telescope name (string),
@@ -397,17 +640,26 @@ class Site:
     
         tel_pos = np.array([tel_enu.e, tel_enu.n, tel_enu.u])
     
+        # -----------------------------
+        # Points: geodetic → ECEF → ENU with the cached origin rotation
+        # -----------------------------
+        if self.origin is None:
+            raise ValueError("Origin must be set before converting to ENU.")
+        if not isinstance(points_geodetic, np.ndarray) or points_geodetic.ndim != 2 or points_geodetic.shape[1] != 3:
+            raise ValueError("Points must be a NumPy array of shape (N,3) as (lat, lon, alt).")
     
-        points_enu = self.geodetic_to_enu(points_geodetic)
+        lat, lon, alt = np.ascontiguousarray(points_geodetic.T, dtype=np.float64)
+        x, y, z = pm.geodetic2ecef(lat, lon, alt)
+        dECEF = np.column_stack([x, y, z]) - self._origin_ecef
     
-        dENU = points_enu - tel_pos
+        points_enu = dECEF @ self._R_ecef_to_enu.T
     
-        az, el, srange = pm.enu2aer(
-            e=dENU[:, 0],
-            n=dENU[:, 1],
-            u=dENU[:, 2],
-        )
+        # -----------------------------
+        # ENU → AER relative to the telescope, fused in one pass
+        # -----------------------------
+        aer = np.empty_like(points_enu)
+        aer_from_enu(points_enu, tel_pos, aer)
     
-        return np.column_stack([az, el, srange])
+        return aer
     
     
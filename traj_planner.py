@@ -1,10 +1,104 @@
 import pymap3d as pm
 from data_containers import Site, ENU, Geodetic, DroneTrajectory
+from _kernels import arc_to_enu
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+import multiprocessing
+import os
 import warnings
 from typing import List
 
+# set DRONE_FLIGHTPLANS_CHECK_ARC_ANGLES=1 to cross-check the closed-form
+# yaw/pitch of the arc builders against the full ENU → AER computation
+_CHECK_ARC_ANGLES = os.environ.get("DRONE_FLIGHTPLANS_CHECK_ARC_ANGLES", "0") == "1"
+
+def _enu_to_aer_vec_rad(de, dn, du):
+    """
+    Vectorized ENU offset → (az [rad], el [rad], slant range [m]),
+    az in [0, 2pi), clockwise from north.
+    """
+    r = np.hypot(de, dn)
+    srange = np.hypot(r, du)
+    el = np.arctan2(du, r)
+    az = np.arctan2(de, dn) % (2*np.pi)
+    return az, el, srange
+
+def _enu_to_aer_vec(de, dn, du):
+    """
+    Vectorized ENU offset → (az [deg], el [deg], slant range [m]),
+    same convention as pm.enu2aer (az in [0, 360), clockwise from north).
+    """
+    r = np.hypot(de, dn)
+    srange = np.hypot(r, du)
+    el = np.degrees(np.arctan2(du, r))
+    az = np.degrees(np.arctan2(de, dn)) % 360
+    return az, el, srange
+
+def _aer_to_enu_vec_rad(az, el, srange):
+    """
+    Vectorized (az [rad], el [rad], slant range [m]) → ENU offset.
+    Scalars and arrays broadcast together.
+    """
+    if np.any(np.asarray(srange) < 0):
+        raise ValueError("Slant range must be in [0, inf).")
+    r = srange * np.cos(el)
+    return r * np.sin(az), r * np.cos(az), srange * np.sin(el)
+
+def _arc_points(az, el_vals, srange, center):
+    """
+    (N,3) ENU points at constant azimuth az [rad] and slant range around
+    center (an ENU), one per elevation in el_vals [rad].
+    """
+    if srange < 0:
+        raise ValueError("Slant range must be in [0, inf).")
+    el_vals = np.ascontiguousarray(el_vals, dtype=np.float64)
+    out = np.empty((el_vals.shape[0], 3))
+    arc_to_enu(float(az), el_vals, float(srange), np.array([center.e, center.n, center.u], dtype=np.float64), out)
+    return out
+
+def _arc_yaw_pitch(az_deg, el_deg):
+    """
+    Yaw/pitch [deg] that point a drone at (az_deg, el_deg) from the POI back
+    at the POI: the opposite direction of (az, el), i.e. yaw = az+180 and
+    pitch = -el. Points past the zenith/nadir (|el| > 90) are folded over to
+    the other side of the arc: they look along az, with pitch -(±180 - el).
+    """
+    el_deg = np.asarray(el_deg, dtype=np.float64)
+    yaw = np.full(el_deg.shape, (az_deg + 180.0) % 360.0)
+    pitch = -el_deg
+    folded = np.abs(el_deg) > 90
+    if np.any(folded):
+        yaw[folded] = az_deg % 360.0
+        pitch[folded] = -(np.copysign(180.0, el_deg[folded]) - el_deg[folded])
+    return yaw, pitch
+
+def _check_arc_angles(enu_points, poi, yaw, pitch):
+    """Assert that the closed-form yaw/pitch point the drone at the POI."""
+    ref_yaw, ref_pitch, _ = _enu_to_aer_vec(
+        -enu_points[:,0] + poi.e,
+        -enu_points[:,1] + poi.n,
+        -enu_points[:,2] + poi.u
+    )
+    dyaw = (yaw - ref_yaw + 180) % 360 - 180
+    assert np.allclose(dyaw, 0, atol=1e-6), "closed-form yaw differs from ENU → AER"
+    assert np.allclose(pitch, ref_pitch, atol=1e-6), "closed-form pitch differs from ENU → AER"
+
+# planner of a scan_grid worker process, set once by _init_worker
+_WORKER_PLANNER = None
+
+def _init_worker(site):
+    global _WORKER_PLANNER
+    _WORKER_PLANNER = TrajectoryPlanner(site)
+
+def _build_one(task):
+    """
+    Worker of TrajectoryPlanner.scan_grid: task is (index, builder, kwargs)
+    and the trajectory is returned with its index. Module level so it pickles.
+    """
+    index, builder, kwargs = task
+    return index, getattr(_WORKER_PLANNER, builder)(**kwargs)
+
 class TrajectoryPlanner:
     
     def __init__(self, site: Site):
@@ -27,7 +121,8 @@ class TrajectoryPlanner:
                 target_enu.u - telescope.enu.u
             )
         elif isinstance(target_enu, np.ndarray):
-            return pm.enu2aer(
+            target_enu = np.asarray(target_enu, dtype=np.float64)
+            return _enu_to_aer_vec(
                 target_enu[:,0] - telescope.enu.e,
                 target_enu[:,1] - telescope.enu.n,
                 target_enu[:,2] - telescope.enu.u
@@ -44,10 +139,26 @@ class TrajectoryPlanner:
         if drone_traj.arccenter:
             arcc = drone_traj.arccenter
         else:
-            e,n,u = drone_traj.enu.mean(axis=0)
+            e,n,u = drone_traj.enu.mean(axis=0, dtype=np.float64)
             arcc = ENU(e=e, n=n, u=u)
 
         return self.telescope_to_target_aer(telescope, arcc)
+
+    def compute_boresights(self, tel_enu_arr, drone_traj):
+        """
+        compute_boresight for several telescopes at once.
+        tel_enu_arr : (T,3) array of telescope ENU positions
+        Returns the (T,) arrays az0, el0.
+        """
+        if drone_traj.arccenter:
+            arcc = drone_traj.arccenter
+            arcc = np.array([arcc.e, arcc.n, arcc.u], dtype=np.float64)
+        else:
+            arcc = drone_traj.enu.mean(axis=0, dtype=np.float64)
+
+        delta = arcc - np.asarray(tel_enu_arr, dtype=np.float64).reshape(-1, 3)
+        az0, el0, _ = _enu_to_aer_vec(delta[:,0], delta[:,1], delta[:,2])
+        return az0, el0
     
     def old_arc_trajectory_202404(self,
                               poi_enu: ENU,
@@ -59,19 +170,13 @@ class TrajectoryPlanner:
                              ):
         el_vals = np.linspace(el_center - el_range/2, el_center + el_range/2, num_steps_el) 
             
-        enu_points = np.zeros((num_steps_el, 3))
-
-        e, n, u = pm.aer2enu(az_center, el_vals, slant_range)
-        enu_points[:, 0] = e + poi_enu.e
-        enu_points[:, 1] = n + poi_enu.n
-        enu_points[:, 2] = u + poi_enu.u
+        enu_points = _arc_points(np.radians(az_center), np.radians(el_vals), slant_range, poi_enu)
         
-        #Compute yaw/pitch to see the POI
-        yaw, pitch, _ = pm.enu2aer(
-            -enu_points[:,0] + poi_enu.e,
-            -enu_points[:,1] + poi_enu.n,
-            -enu_points[:,2] + poi_enu.u
-        )
+        #Compute yaw/pitch to see the POI: the drone looks back along the
+        #arc radius, i.e. the opposite direction of (az_center, el_vals)
+        yaw, pitch = _arc_yaw_pitch(az_center, el_vals)
+        if _CHECK_ARC_ANGLES:
+            _check_arc_angles(enu_points, poi_enu, yaw, pitch)
 
         trajectory = DroneTrajectory(enu=enu_points, 
                                      yaw=yaw, 
@@ -98,10 +203,11 @@ class TrajectoryPlanner:
                                  ):
         
         #Compute arc center ENU relative to nominal POI
-        arccenter_e, arccenter_n, arccenter_u = pm.aer2enu(
-            az=nominal_az,
-            el=nominal_el,
-            srange=nominal_srange
+        #(angles are kept in radians until the DroneTrajectory is built)
+        arccenter_e, arccenter_n, arccenter_u = _aer_to_enu_vec_rad(
+            np.radians(nominal_az),
+            np.radians(nominal_el),
+            nominal_srange
         )
         arccenter_e += nominal_poi.e
         arccenter_n += nominal_poi.n
@@ -110,29 +216,24 @@ class TrajectoryPlanner:
         arccenter = ENU(e=arccenter_e, n=arccenter_n, u=arccenter_u)         
         
         # we find the center az,el position of the drone as seen by the poi
-        az0, el0, srange0 = pm.enu2aer(
+        az0, el0, srange0 = _enu_to_aer_vec_rad(
                 arccenter_e-poi.e, 
                 arccenter_n-poi.n,
                 arccenter_u-poi.u
                 )
         
         #we move on an arc by modulating the el
-        el_vals = np.linspace(el0 - delta_el/2, el0 + delta_el/2, num_steps_el)
+        half_delta_el = np.radians(delta_el)/2
+        el_vals = np.linspace(el0 - half_delta_el, el0 + half_delta_el, num_steps_el)
         
-        enu_points = np.zeros((num_steps_el, 3))
         # ENU position relative to POI
-        e, n, u = pm.aer2enu(az=az0, el=el_vals, srange=srange0)
-        
-        enu_points[:, 0] = e + poi.e
-        enu_points[:, 1] = n + poi.n
-        enu_points[:, 2] = u + poi.u
-
-        # Compute yaw/pitch to see the POI
-        yaw, pitch, _ = pm.enu2aer(
-            -enu_points[:,0] + poi.e,
-            -enu_points[:,1] + poi.n,
-            -enu_points[:,2] + poi.u
-        )
+        enu_points = _arc_points(az0, el_vals, srange0, poi)
+
+        # Compute yaw/pitch to see the POI: the drone looks back along the
+        # arc radius, i.e. the opposite direction of (az0, el_vals)
+        yaw, pitch = _arc_yaw_pitch(np.degrees(az0), np.degrees(el_vals))
+        if _CHECK_ARC_ANGLES:
+            _check_arc_angles(enu_points, poi, yaw, pitch)
         
         trajectory = DroneTrajectory(
             enu=enu_points,
@@ -147,6 +248,32 @@ class TrajectoryPlanner:
         trajectory.landing_site = self.site.landing_site
         return trajectory
         
+    def scan_grid(self, param_grid, processes=None, builder="new_arc_trajectory_202412"):
+        """
+        Build one trajectory per entry of param_grid (a list of keyword
+        dicts for `builder`) using a pool of `processes` worker processes
+        (default: one per core, at most one per entry). With a single worker
+        they are built sequentially here, without a pool.
+        Returns the trajectories in the order of param_grid.
+        """
+        param_grid = list(param_grid)
+        nproc = min(processes or os.cpu_count() or 1, len(param_grid))
+        if nproc <= 1:
+            build = getattr(self, builder)
+            return [build(**kwargs) for kwargs in param_grid]
+
+        tasks = [(i, builder, kwargs) for i, kwargs in enumerate(param_grid)]
+        trajectories = [None]*len(tasks)
+        # spawn, not fork: workers start from a clean interpreter whatever
+        # state (threads, open figures) the caller has built up.
+        # The site is sent once per worker, not once per task.
+        ctx = multiprocessing.get_context("spawn")
+        chunksize = max(1, len(tasks) // (4 * nproc))
+        with ctx.Pool(nproc, initializer=_init_worker, initargs=(self.site,)) as pool:
+            for i, trajectory in pool.imap_unordered(_build_one, tasks, chunksize):
+                trajectories[i] = trajectory
+        return trajectories
+        
     def plot_trajectories(
             self,
             trajectories,
@@ -193,27 +320,43 @@ class TrajectoryPlanner:
 
         azel_summary = []
         markers = ["o", "s", "D", "^", "v", "*", "P", "X",]
+        segs, colors, boresights = [], [], []
+
+        # resolve the telescopes once, positions as a (T,3) array
+        tel_objs = [self.site.telescopes[name] for name in telescopes]
+        tel_enu = np.fromiter(
+            (c for tel in tel_objs for c in (tel.enu.e, tel.enu.n, tel.enu.u)),
+            dtype=np.float64, count=3*len(tel_objs)
+        ).reshape(-1, 3)
 
         #Loop over trajectories
         for j, (traj_name, drone_traj) in enumerate(traj_dict.items()):
 
-            for i, telescope_name in enumerate(telescopes):
-                tel = self.site.telescopes[telescope_name]
+            # az/el from every telescope to every drone point, shape (T,N)
+            delta = np.asarray(drone_traj.enu, dtype=np.float64)[None,:,:] - tel_enu[:,None,:]
+            az_all, el_all, _ = _enu_to_aer_vec(*delta.transpose(2,0,1))
 
-                # az/el from telescope to drone
-                az, el, srange = self.telescope_to_target_aer(tel,drone_traj.enu)
+            # boresight (the arccenter as seen by each telescope)
+            az0_all, el0_all = self.compute_boresights(tel_enu, drone_traj)
 
-                # find boresight (boresight is the arccenter as seen by the telescope)
-                az0, el0, _ = self.compute_boresight(tel, drone_traj)
+            for i, telescope_name in enumerate(telescopes):
+                az0, el0 = az0_all[i], el0_all[i]
 
                 if drone_traj.plot_boresight:
                     azel_summary.append([telescope_name, traj_name, f"{az0:.2f}", f"{el0:.2f}"])
+                    boresights.append((az0, el0))
 
-                # plot
-                #ax1.plot(az, el, linestyle = "-", marker=markers[j%len(markers)], color=f"C{i}", label=f"{traj_name} – {telescope_name}")
-                ax1.plot(az, el, linestyle = "-", color=f"C{i}", label=f"{traj_name} – {telescope_name}")
-                if drone_traj.plot_boresight:
-                    ax1.scatter(az0, el0, marker="x", color="black")
+                # collect the line, one color per telescope
+                segs.append(np.column_stack([az_all[i], el_all[i]]))
+                colors.append(f"C{i}")
+
+        # plot all the lines, then all the boresights, in one artist each
+        if segs:
+            ax1.add_collection(LineCollection(segs, colors=colors, linestyles="-"))
+            ax1.autoscale_view()
+        if boresights:
+            az0_arr, el0_arr = np.array(boresights).T
+            ax1.scatter(az0_arr, el0_arr, marker="x", color="black")
 
         ax1.grid()
         ax1.set_title(title)
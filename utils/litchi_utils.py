@@ -1,6 +1,22 @@
 #https://www.litchiutilities.com.wesbarris.com/docs/litchiCsv.php
 
+import functools
 import json
+import os
+
+import numpy as np
+
+GEOFENCE_PATH = "coords/site_geofence.json"
+
+@functools.lru_cache(maxsize=1)
+def _parse_geofence(path, mtime):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def load_geofence(path=GEOFENCE_PATH):
+    """Return the parsed geofence file; it is re-read only when modified on disk.
+    The dict is shared between calls: copy before modifying it."""
+    return _parse_geofence(path, os.path.getmtime(path))
 
 def litchi_safety_points(
     direction:str, 
@@ -20,8 +36,7 @@ def litchi_safety_points(
 
     heading = {"south": 0, "north": 180, "east": 270, "west": 90}.get(direction)
     
-    with open("coords/site_geofence.json", "r") as f:
-            data = json.load(f)
+    data = load_geofence()
     
     safety_points = data["safety_waypoints"][direction]
     
@@ -81,4 +96,14 @@ def litchi_waypoint(
              poi_alt,
              poi_altitudemode,
             ]
-        
\ No newline at end of file
+
+def litchi_waypoints_bulk(lat, lon, alt, heading, curvesize, gimbalpitchangle, speed, poi_lat, poi_lon, poi_alt, **kwargs):
+    """
+    Same as litchi_waypoint for N points at once, returned column-wise: lat,
+    lon and alt are (N,) arrays, the other arguments scalars or (N,) arrays.
+    Returns the 16 (N,) columns in litchi_waypoint order; each keeps the dtype
+    of its argument, so integer flags stay integers.
+    """
+    n = len(lat)
+    columns = litchi_waypoint(lat, lon, alt, heading, curvesize, gimbalpitchangle, speed, poi_lat, poi_lon, poi_alt, **kwargs)
+    return [np.broadcast_to(col, n) for col in columns]
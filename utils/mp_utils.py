@@ -1,13 +1,27 @@
+import numpy as np
+
 #https://ardupilot.org/planner/docs/common-mavlink-mission-command-messages-mav_cmd.html
 #https://docs.rs/mavlink/latest/mavlink/common/enum.MavCmd.html
+
+# MAVLink command ids, frames and altitude modes of the items we emit
+WP_CMD, WP_FRAME, WP_ALTMODE = 16, 3, 1
+ROI_CMD, ROI_FRAME, ROI_ALTMODE = 195, 3, 1
+RTH_CMD, RTH_FRAME, RTH_ALTMODE = 20, 2, 3
+SPEED_CMD, SPEED_FRAME, SPEED_ALTMODE = 178, 2, None
+DELAY_CMD, DELAY_FRAME, DELAY_ALTMODE = 19, 2, None
+
+# same values by command name, for external callers
 MAVLINK_COMMANDS = {
-        "waypoint": {"cmd": 16, "altmode": 1, "frame": 3},
-        "roi": {"cmd": 195, "altmode": 1, "frame": 3},
-        "rth": {"cmd": 20, "altmode": 3, "frame": 2},
-        "speed": {"cmd": 178, "altmode": None, "frame": 2},
-        "delay": {"cmd": 19, "altmode": None, "frame":2 }
+        "waypoint": {"cmd": WP_CMD, "altmode": WP_ALTMODE, "frame": WP_FRAME},
+        "roi": {"cmd": ROI_CMD, "altmode": ROI_ALTMODE, "frame": ROI_FRAME},
+        "rth": {"cmd": RTH_CMD, "altmode": RTH_ALTMODE, "frame": RTH_FRAME},
+        "speed": {"cmd": SPEED_CMD, "altmode": SPEED_ALTMODE, "frame": SPEED_FRAME},
+        "delay": {"cmd": DELAY_CMD, "altmode": DELAY_ALTMODE, "frame": DELAY_FRAME}
     }
 
+# one line of the .waypoints file (tab separated, newline terminated)
+_TEMPLATE = "%d\t%d\t%d\t%d\t%.6f\t%.6f\t%.6f\t%.6f\t%.8f\t%.8f\t%.6f\t%d\n"
+
 def header():
     return "QGC WPL 110\n"
     
@@ -25,30 +39,16 @@ def make_item(
     z: float = 0.,
     autocontinue: int = 1
 ):
-    return (
-        f"{seq}\t"
-        f"{current}\t"
-        f"{frame}\t"
-        f"{command}\t"
-        f"{param1:.6f}\t"
-        f"{param2:.6f}\t"
-        f"{param3:.6f}\t"
-        f"{param4:.6f}\t"
-        f"{x:.8f}\t"
-        f"{y:.8f}\t"
-        f"{z:.6f}\t"
-        f"{autocontinue}\n"
-    )
+    return _TEMPLATE % (seq, current, frame, command, param1, param2, param3, param4, x, y, z, autocontinue)
 
 def waypoint (seq, lat, lon, alt, current=0 ,autocontinue=1, frame=None):
-    cmd_info = MAVLINK_COMMANDS["waypoint"]
     if not frame:
-        frame = cmd_info["frame"]
+        frame = WP_FRAME
     return make_item(
         seq, 
         current, 
         frame,
-        cmd_info["cmd"],
+        WP_CMD,
         0,
         0,
         0,
@@ -59,14 +59,28 @@ def waypoint (seq, lat, lon, alt, current=0 ,autocontinue=1, frame=None):
         autocontinue
     )
 
+def waypoints_bulk(lats, lons, alts, start_seq, current=0, autocontinue=1, frame=None):
+    """Waypoint items for (N,) arrays of lat/lon/alt, numbered from start_seq, as one string."""
+    if not frame:
+        frame = WP_FRAME
+    head = (current, frame, WP_CMD, 0, 0, 0, 0)
+    return "".join([
+        _TEMPLATE % ((seq,) + head + (lat, lon, alt, autocontinue))
+        for seq, lat, lon, alt in zip(
+            range(start_seq, start_seq+len(lats)),
+            np.asarray(lats, dtype=np.float64).tolist(),
+            np.asarray(lons, dtype=np.float64).tolist(),
+            np.asarray(alts, dtype=np.float64).tolist(),
+        )
+    ])
+
 def rth(seq: int, current: int = 0, autocontinue: int = 1) -> str:
     """Create a Return-to-Launch mission item."""
-    cmd_info = MAVLINK_COMMANDS["rth"]
     return make_item(
         seq=seq,
         current=current,
-        frame=cmd_info["frame"],
-        command=cmd_info["cmd"],
+        frame=RTH_FRAME,
+        command=RTH_CMD,
         param1=0,
         param2=0,
         param3=0,
@@ -79,13 +93,12 @@ def rth(seq: int, current: int = 0, autocontinue: int = 1) -> str:
 
 def speed(seq: int, speed_value: float, current: int = 0, autocontinue: int = 1) -> str:
     """Create a speed change mission item."""
-    cmd_info = MAVLINK_COMMANDS["speed"]
     # Standard param mapping: param1=type (1 = airspeed), param2=value, param3=-1 (unused)
     return make_item(
         seq=seq,
         current=current,
-        frame=cmd_info["frame"],
-        command=cmd_info["cmd"],
+        frame=SPEED_FRAME,
+        command=SPEED_CMD,
         param1=0,
         param2=speed_value,
         param3=0,
@@ -98,12 +111,11 @@ def speed(seq: int, speed_value: float, current: int = 0, autocontinue: int = 1)
 
 def roi(seq: int, lat: float, lon: float, alt: float, current: int = 0, autocontinue: int = 1) -> str:
     """Create a ROI (Region of Interest) mission item."""
-    cmd_info = MAVLINK_COMMANDS["roi"]
     return make_item(
         seq=seq,
         current=current,
-        frame=cmd_info["frame"],
-        command=cmd_info["cmd"],
+        frame=ROI_FRAME,
+        command=ROI_CMD,
         param1=0,
         param2=0,
         param3=0,
@@ -117,12 +129,11 @@ def roi(seq: int, lat: float, lon: float, alt: float, current: int = 0, autocont
 
 def delay(seq: int, time_s: float, current: int = 0, autocontinue: int = 1) -> str:
     """Create a speed change mission item."""
-    cmd_info = MAVLINK_COMMANDS["delay"]
     return make_item(
         seq=seq,
         current=current,
-        frame=cmd_info["frame"],#unused
-        command=cmd_info["cmd"],
+        frame=DELAY_FRAME,#unused
+        command=DELAY_CMD,
         param1=time_s,
         param2=0,
         param3=0,
@@ -1,15 +1,68 @@
 # https://docs.qgroundcontrol.com/master/en/qgc-dev-guide/file_formats/plan.html
 
+from dataclasses import dataclass
 from typing import List, Optional
+import json
 
+import numpy as np
+
+from _compat import _slots
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# On-disk .plan layout, the same as the files already under outputs/
+PLAN_INDENT = 4
+
+# MAVLink command ids, frames and altitude modes of the items we emit
+WP_CMD, WP_FRAME, WP_ALTMODE = 16, 3, 1
+ROI_CMD, ROI_FRAME, ROI_ALTMODE = 195, 3, 1
+RTH_CMD, RTH_FRAME, RTH_ALTMODE = 20, 2, 3
+SPEED_CMD, SPEED_FRAME, SPEED_ALTMODE = 178, 2, None
+DELAY_CMD, DELAY_FRAME, DELAY_ALTMODE = 19, 2, None
+
+# same values by command name, for external callers
 MAVLINK_COMMANDS = {
-        "waypoint": {"cmd": 16, "altmode": 1, "frame": 3},
-        "roi": {"cmd": 195, "altmode": 1, "frame": 3},
-        "rth": {"cmd": 20, "altmode": 3, "frame": 2},
-        "speed": {"cmd": 178, "altmode": None, "frame": 2},
-        "delay": {"cmd": 19, "altmode": None, "frame":2 }
+        "waypoint": {"cmd": WP_CMD, "altmode": WP_ALTMODE, "frame": WP_FRAME},
+        "roi": {"cmd": ROI_CMD, "altmode": ROI_ALTMODE, "frame": ROI_FRAME},
+        "rth": {"cmd": RTH_CMD, "altmode": RTH_ALTMODE, "frame": RTH_FRAME},
+        "speed": {"cmd": SPEED_CMD, "altmode": SPEED_ALTMODE, "frame": SPEED_FRAME},
+        "delay": {"cmd": DELAY_CMD, "altmode": DELAY_ALTMODE, "frame": DELAY_FRAME}
     }
 
+@_slots
+@dataclass
+class MissionItem:
+    """One item of the plan's mission; to_dict() gives its JSON form."""
+    doJumpId: int
+    command: int
+    frame: int
+    params: List[float]
+    autoContinue: bool = True
+    type: str = "SimpleItem"
+    AMSLAltAboveTerrain: Optional[float] = None
+    # only set for positional items (waypoint, roi)
+    Altitude: Optional[float] = None
+    AltitudeMode: Optional[int] = None
+    
+    def to_dict(self):
+        item = {
+            "doJumpId": self.doJumpId,
+            "command": self.command,
+            "frame": self.frame,
+            "params": self.params,
+            "autoContinue": self.autoContinue,
+            "type": self.type,
+            "AMSLAltAboveTerrain": self.AMSLAltAboveTerrain,
+        }
+        if self.Altitude is not None:
+            item["Altitude"] = self.Altitude
+            item["AltitudeMode"] = self.AltitudeMode
+        return item
+
 def mission_item(
     doJumpId: int,
     command: int,
@@ -34,16 +87,14 @@ def qgc_waypoint(
         lon: float,
         alt: float,
     ):
-    mav = MAVLINK_COMMANDS["waypoint"]
-    
     waypoint = mission_item(
         doJumpId = doJumpId,
-        command = mav["cmd"],
-        frame = mav["frame"],
+        command = WP_CMD,
+        frame = WP_FRAME,
         params = [0, 0, 0, 0, lat, lon, alt],
                       )
     waypoint["Altitude"] = alt
-    waypoint["AltitudeMode"]= mav["altmode"]
+    waypoint["AltitudeMode"]= WP_ALTMODE
     
     return waypoint
 
@@ -53,29 +104,24 @@ def qgc_poi(
     lon: float,
     alt: float,
 ):
-    
-    mav = MAVLINK_COMMANDS["roi"]
-    
     item = mission_item(
         doJumpId=doJumpId,
-        command=mav["cmd"],
-        frame=mav["frame"],
+        command=ROI_CMD,
+        frame=ROI_FRAME,
         params=[0, 0, 0, 0, lat, lon, alt],
     )
     item["Altitude"] = alt
-    item["AltitudeMode"] = mav["altmode"]
+    item["AltitudeMode"] = ROI_ALTMODE
     return item
 
 def qgc_speed(
     doJumpId: int, 
     speed: float
 ):
-    mav = MAVLINK_COMMANDS["speed"]
-    
     item = mission_item(
         doJumpId=doJumpId,
-        command=mav["cmd"],
-        frame=mav["frame"],
+        command=SPEED_CMD,
+        frame=SPEED_FRAME,
         params=[1, speed, -1, 0, 0, 0, 0],  # standard speed params
     )
     return item
@@ -83,11 +129,10 @@ def qgc_speed(
 
 def qgc_rth(doJumpId: int):
     """Create a Return-To-Launch mission item."""
-    mav = MAVLINK_COMMANDS["rth"]
     item = mission_item(
         doJumpId=doJumpId,
-        command=mav["cmd"],
-        frame=mav["frame"],
+        command=RTH_CMD,
+        frame=RTH_FRAME,
         params=[0] * 7,  # RTH params are unused
     )
     return item
@@ -96,12 +141,10 @@ def qgc_delay(
     doJumpId: int,
     time_s:float,
     ):
-    mav = MAVLINK_COMMANDS["delay"]
-    
     item = mission_item(
         doJumpId = doJumpId,
-        command = mav["cmd"],
-        frame = mav["frame"], #unused
+        command = DELAY_CMD,
+        frame = DELAY_FRAME, #unused
         params = [time_s, 0, 0, 0, 0, 0, 0],
     )
     
@@ -109,21 +152,62 @@ def qgc_delay(
 
 
 
+class WaypointList:
+    """
+    Mission items of a plan, numbered (doJumpId) as they are added.
+    Items are kept as MissionItem and converted to dicts by to_list().
+    """
+    __slots__ = ("_items", "_next_id")
+    
+    def __init__(self):
+        self._items = []
+        self._next_id = 1
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def _add(self, command, frame, params, alt=None, altmode=None):
+        self._items.append(MissionItem(self._next_id, command, frame, params, True, "SimpleItem", None, alt, altmode))
+        self._next_id += 1
+        return self
+    
+    def add_waypoint(self, lat: float, lon: float, alt: float):
+        return self._add(WP_CMD, WP_FRAME, [0, 0, 0, 0, lat, lon, alt], alt, WP_ALTMODE)
+    
+    def add_waypoints(self, lats, lons, alts):
+        """Add one waypoint per (lat, lon, alt) of the given sequences."""
+        first_id = self._next_id
+        self._items.extend([
+            MissionItem(first_id+i, WP_CMD, WP_FRAME, [0, 0, 0, 0, lat, lon, alt], True, "SimpleItem", None, alt, WP_ALTMODE)
+            for i, (lat, lon, alt) in enumerate(zip(lats, lons, alts))
+        ])
+        self._next_id = len(self._items)+1
+        return self
+    
+    def add_poi(self, lat: float, lon: float, alt: float):
+        return self._add(ROI_CMD, ROI_FRAME, [0, 0, 0, 0, lat, lon, alt], alt, ROI_ALTMODE)
+    
+    def add_speed(self, speed: float):
+        return self._add(SPEED_CMD, SPEED_FRAME, [1, speed, -1, 0, 0, 0, 0])
+    
+    def add_rth(self):
+        return self._add(RTH_CMD, RTH_FRAME, [0] * 7)
+    
+    def add_delay(self, time_s: float):
+        return self._add(DELAY_CMD, DELAY_FRAME, [time_s, 0, 0, 0, 0, 0, 0])
+    
+    def to_list(self):
+        """The mission items as JSON-ready dicts."""
+        return [item.to_dict() for item in self._items]
+
+
 def append_waypoint(
         waypoints: List,
         lat: float,
         lon: float,
         alt: float,
     ):
-    doJumpId = len(waypoints)+1
-    
-    waypoint = qgc_waypoint(
-        doJumpId=doJumpId,
-        lat=lat,
-        lon=lon,
-        alt=alt,
-        )
-    waypoints.append(waypoint)
+    waypoints.append(qgc_waypoint(doJumpId=len(waypoints)+1, lat=lat, lon=lon, alt=alt))
     return waypoints
 
 
@@ -133,50 +217,52 @@ def append_poi(
         lon: float,
         alt: float,
     ):
-    doJumpId = len(waypoints)+1
-    
-    waypoint = qgc_poi(
-        doJumpId=doJumpId,
-        lat=lat,
-        lon=lon,
-        alt=alt,
-        )
-    waypoints.append(waypoint)
+    waypoints.append(qgc_poi(doJumpId=len(waypoints)+1, lat=lat, lon=lon, alt=alt))
     return waypoints
 
 def append_speed(
         waypoints: List,
         speed: float
     ):
-    doJumpId = len(waypoints)+1
-    
-    waypoint = qgc_speed(
-        doJumpId=doJumpId,
-        speed=speed,
-        )
-    waypoints.append(waypoint)
+    waypoints.append(qgc_speed(doJumpId=len(waypoints)+1, speed=speed))
     return waypoints
 
 def append_rth(
         waypoints: List,
     ):
-    doJumpId = len(waypoints)+1
-    
-    waypoint = qgc_rth(
-        doJumpId=doJumpId,
-        )
-    waypoints.append(waypoint)
+    waypoints.append(qgc_rth(doJumpId=len(waypoints)+1))
     return waypoints
 
 def append_delay(
         waypoints: List,
         time_s: float
     ):
-    doJumpId = len(waypoints)+1
-    
-    waypoint = qgc_delay(
-        doJumpId=doJumpId,
-        time_s=time_s,
-        )
-    waypoints.append(waypoint)
-    return waypoints
\ No newline at end of file
+    waypoints.append(qgc_delay(doJumpId=len(waypoints)+1, time_s=time_s))
+    return waypoints
+
+
+def _json_default(obj):
+    """Serialize the non-JSON types that can end up in a plan."""
+    if isinstance(obj, MissionItem):
+        return obj.to_dict()
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_plan(plan) -> bytes:
+    """
+    Serialize a plan to compact JSON bytes (no indentation), for sending or
+    hashing rather than saving. Uses orjson when installed.
+    """
+    if HAVE_ORJSON:
+        return orjson.dumps(plan, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(plan, separators=(",", ":"), default=_json_default).encode()
+
+def dump_plan(plan, path: str):
+    """
+    Write a plan (or any JSON-able object, MissionItems included) to path
+    with the json module, indented by PLAN_INDENT spaces whether or not
+    orjson is installed (orjson can only indent by 2).
+    """
+    with open(path, "w") as f:
+        json.dump(plan, f, indent=PLAN_INDENT, default=_json_default)